@@ -1,25 +1,60 @@
 """FastAPI backend for LLM Parliament."""
 
+import logging
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from sse_starlette.sse import EventSourceResponse, ServerSentEvent
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
+import os
 import uuid
-import json
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+
+import orjson
 
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import HumanMessage, AIMessageChunk
 
 from . import storage
-from .debate_graph import build_debate_graph
-from .openrouter import get_chat_model # Import for title generation
+from .debate_graph import build_debate_graph, get_ascii_graph
+from .openrouter import get_chat_model, prewarm_connection_pool
+from .tools import search_client
+
+# Compiled once: the graph topology (and therefore its ASCII rendering)
+# is identical for every request
+_GRAPH_APP = build_debate_graph()
+_ASCII_GRAPH = get_ascii_graph()
+
+# MLflow tracing is opt-in (ENABLE_MLFLOW=1): the tracer logs to the
+# tracking server on every LangChain event, which would otherwise sit right
+# on the SSE hot path - and a hard dependency on a local tracking server
+# shouldn't be the default.
+ENABLE_MLFLOW = os.getenv("ENABLE_MLFLOW", "").lower() in ("1", "true", "yes")
+
+if ENABLE_MLFLOW:
+    import mlflow
+    from mlflow.langchain.langchain_tracer import MlflowLangchainTracer
 
-import mlflow
-from mlflow.langchain.langchain_tracer import MlflowLangchainTracer
+    mlflow.set_tracking_uri(os.getenv("MLFLOW_TRACKING_URI", "http://127.0.0.1:5000"))
+    mlflow.set_experiment("LLM Parliament")
+    _TRACER = MlflowLangchainTracer()
+else:
+    _TRACER = None
 
-mlflow.set_tracking_uri("http://127.0.0.1:5000")
-mlflow.set_experiment("LLM Parliament")
+def _mlflow_run(run_name: str):
+    """Run-context for tracing, or a no-op when MLflow is disabled."""
+    if ENABLE_MLFLOW:
+        return mlflow.start_run(run_name=run_name, nested=True)
+    return nullcontext()
+
+# Root logging config lives here since main.py is the entrypoint; module
+# loggers elsewhere stay unconfigured. print() was a blocking flush to
+# stdout on every call - under piped container stdout that serializes
+# concurrent SSE streams, and logging is droppable by level instead.
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
+logger = logging.getLogger(__name__)
 
 
 app = FastAPI(title="LLM Parliament API")
@@ -33,6 +68,26 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("startup")
+async def bound_default_executor():
+    # All sync storage I/O runs through the loop's default executor
+    # (to_thread / run_in_executor(None, ...)). Unbounded, it grows a thread
+    # per concurrent blocking call under an SSE load spike; 16 workers is
+    # plenty for small JSONL appends while keeping memory flat.
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=16, thread_name_prefix="storage-io")
+    )
+
+@app.on_event("startup")
+async def prewarm_openrouter():
+    # Establish the TLS session to OpenRouter now, not on the first debate
+    await prewarm_connection_pool()
+
+@app.on_event("shutdown")
+async def close_search_client():
+    # The search tool's shared connection pool lives for the whole process
+    await search_client.aclose()
+
 class CreateConversationRequest(BaseModel):
     pass
 
@@ -40,6 +95,10 @@ class DebateConfig(BaseModel):
     pro_model: str = "anthropic/claude-3.5-sonnet"
     con_model: str = "anthropic/claude-3.5-sonnet"
     moderator_model: str = "anthropic/claude-3.5-sonnet"
+    # The per-turn scoring/transition and summary calls run far more often
+    # than the kickoff/final summary, so they default to small models
+    moderator_transition_model: str = "anthropic/claude-3-haiku"
+    summary_model: str = "openai/gpt-4o-mini"
     max_rounds: int = 3
     enable_tools: bool = True
 
@@ -47,8 +106,30 @@ class SendMessageRequest(BaseModel):
     content: str
     config: Optional[DebateConfig] = None
 
+# Default debate configuration, built once; requests without an explicit
+# config get a shallow copy with just topic/ascii_graph patched in
+_DEFAULT_CONFIG_TEMPLATE = {
+    "pro_model": "anthropic/claude-3.5-sonnet",
+    "con_model": "anthropic/claude-3.5-sonnet",
+    "moderator_model": "anthropic/claude-3.5-sonnet",
+    "moderator_transition_model": "anthropic/claude-3-haiku",
+    "summary_model": "openai/gpt-4o-mini",
+    "max_rounds": 3,
+    "enable_tools": True
+}
+
+def local_title(content: str) -> Optional[str]:
+    """Short prompts already are their own title - no LLM needed."""
+    words = content.strip().split()
+    return " ".join(words[:5]) if len(words) <= 8 else None
+
 async def generate_conversation_title(content: str) -> str:
     """Generate a short title for the conversation using a cheap model."""
+    # Try the free path first: for a short topic the first few words beat
+    # a network round-trip plus billed tokens
+    title = local_title(content)
+    if title:
+        return title
     try:
         # Use a reliable fast model for title generation
         llm = get_chat_model("google/gemini-2.5-flash", temperature=0.7)
@@ -56,10 +137,10 @@ async def generate_conversation_title(content: str) -> str:
             {"role": "system", "content": "Generate a very short, 3-5 word title for this debate topic. Do not use quotes."},
             {"role": "user", "content": content}
         ]
-        response = llm.invoke(messages)
+        response = await llm.ainvoke(messages)
         return response.content.strip().strip('"')
     except Exception as e:
-        print(f"Title generation failed: {e}")
+        logger.warning("Title generation failed: %s", e)
         return "New Debate"
 
 @app.get("/")
@@ -68,17 +149,18 @@ async def root():
 
 @app.get("/api/conversations")
 async def list_conversations():
-    return storage.list_conversations()
+    # Filesystem scans block; keep them off the event loop
+    return await asyncio.to_thread(storage.list_conversations)
 
 @app.post("/api/conversations")
 async def create_conversation(request: CreateConversationRequest):
     conversation_id = str(uuid.uuid4())
-    conversation = storage.create_conversation(conversation_id)
+    conversation = await asyncio.to_thread(storage.create_conversation, conversation_id)
     return conversation
 
 @app.get("/api/conversations/{conversation_id}")
 async def get_conversation(conversation_id: str):
-    conversation = storage.get_conversation(conversation_id)
+    conversation = await asyncio.to_thread(storage.get_conversation, conversation_id)
     if conversation is None:
         raise HTTPException(status_code=404, detail="Conversation not found")
     return conversation
@@ -88,7 +170,7 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
     """
     Stream the debate graph execution.
     """
-    conversation = storage.get_conversation(conversation_id)
+    conversation = await asyncio.to_thread(storage.get_conversation, conversation_id)
     if conversation is None:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
@@ -96,116 +178,186 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
     
     # Save User Message
     user_msg = {"role": "user", "content": request.content, "name": "User"}
-    storage.add_message(conversation_id, user_msg)
+    await asyncio.to_thread(storage.add_message, conversation_id, user_msg)
 
-    # Build Logic Graph
-    graph_app = build_debate_graph()
-    
     # Prepare Initial State
     # FIX: Pydantic v2 uses model_dump(), .dict() is deprecated
-    config_dict = request.config.model_dump() if request.config else {
-        "pro_model": "anthropic/claude-3.5-sonnet",
-        "con_model": "anthropic/claude-3.5-sonnet",
-        "moderator_model": "anthropic/claude-3.5-sonnet",
-        "max_rounds": 3,
-        "enable_tools": True,
-        "topic": request.content
-    }
+    config_dict = (
+        request.config.model_dump() if request.config
+        else _DEFAULT_CONFIG_TEMPLATE.copy()
+    )
     
     # Ensure topic is set
     config_dict["topic"] = request.content
-    
-    # Generate Dynamic ASCII Graph
-    try:
-        from langchain_core.runnables.graph import MermaidDrawMethod
-        # draw_ascii() is a method on the CompiledGraph.get_graph()
-        ascii_graph = graph_app.get_graph().draw_ascii()
-        config_dict["ascii_graph"] = ascii_graph
-    except Exception as e:
-        print(f"Failed to draw ASCII graph: {e}")
-        config_dict["ascii_graph"] = "[Graph Visualization Failed]"
+
+    # Pre-rendered at module import; the topology never changes per request
+    config_dict["ascii_graph"] = _ASCII_GRAPH
 
     initial_state = {
         "messages": [HumanMessage(content=request.content)],
         "config": config_dict,
         "round_count": 0,
         "speaker_order": [],
-        "next_speaker": "moderator"
+        "next_speaker": "moderator",
+        "last_agent_speaker": "",
+        "running_summary": "",
+        "summary_upto": 0
     }
 
     async def event_generator():
+        # Bounded handoff between the graph producer and the SSE writer.
+        # A client that reads slowly would otherwise make Starlette buffer
+        # frames without limit (and OOM eventually): instead the producer
+        # blocks on a full queue for frames that must arrive (messages,
+        # title, complete, error) - pacing the graph itself - and simply
+        # drops the cosmetic ones (moderator status lines).
+        queue = asyncio.Queue(maxsize=32)
+        done = object()
+
+        async def send(payload: dict, critical: bool = True):
+            event = ServerSentEvent(data=orjson.dumps(payload).decode())
+            if critical:
+                await queue.put(event)
+                return
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                pass # Slow client; this frame is droppable
+
+        async def produce():
+            client_gone = False
+            try:
+                # 1. Title generation is an independent LLM call the graph never
+                # reads, so it runs concurrently with the debate's first turn
+                # instead of delaying it. The frame is emitted whenever the task
+                # resolves (checked at each stream iteration below).
+                title_task = (
+                    asyncio.create_task(generate_conversation_title(request.content))
+                    if is_first_message else None
+                )
+
+                async def _finish_title(wait: bool = False):
+                    nonlocal title_task
+                    if title_task is None or not (wait or title_task.done()):
+                        return
+                    title = await title_task
+                    title_task = None
+                    await asyncio.to_thread(storage.update_conversation_title, conversation_id, title)
+                    await send({'type': 'title', 'data': title})
+
+                # 2. Stream Graph Events
+                # We use 'updates' mode to see what each node produces
+                config = {"callbacks": [_TRACER]} if _TRACER else {}
+
+                with _mlflow_run(f"Debate: {conversation_id[:8]}"):
+                    # Multi-mode streaming: 'messages' surfaces token chunks
+                    # as the LLMs generate (first text on screen in ~200ms
+                    # instead of after a full node), 'updates' still delivers
+                    # the completed node outputs for storage + final frames.
+                    async for mode, payload in _GRAPH_APP.astream(
+                        initial_state, config=config, stream_mode=["updates", "messages"]
+                    ):
+                        await _finish_title()
+
+                        if mode == "messages":
+                            chunk, meta = payload
+                            # Only genuine streamed chunks - a non-streaming
+                            # call (summaries, transitions) lands as a full
+                            # AIMessage here and shouldn't flash on screen
+                            if isinstance(chunk, AIMessageChunk) and chunk.content:
+                                await send({
+                                    "type": "token",
+                                    "data": {
+                                        "content": chunk.content,
+                                        "node": meta.get("langgraph_node")
+                                    }
+                                }, critical=False) # A dropped token frame only
+                                                   # degrades the live preview
+                            continue
+
+                        for node_name, node_output in payload.items():
+
+                            # Extract messages from the node output. A node can
+                            # return several at once (paired openings, parallel
+                            # tool results) - emit all of them, not just the last.
+                            if "messages" in node_output and node_output["messages"]:
+                                batch = []
+                                for raw_msg in node_output["messages"]:
+                                    sender_name = getattr(raw_msg, "name", node_name)
+                                    msg_type = "message"
+
+                                    # Detect Message Type
+                                    if raw_msg.type == "tool":
+                                        msg_type = "tool_output"
+                                        sender_name = "Tool" # Or specific tool name if available
+                                    elif raw_msg.type == "ai" and getattr(raw_msg, "tool_calls", None):
+                                        msg_type = "tool_call"
+
+                                    batch.append({
+                                        "type": msg_type,
+                                        "data": {
+                                            "role": "assistant" if raw_msg.type == "ai" else "tool",
+                                            "name": sender_name,
+                                            "content": raw_msg.content,
+                                            "tool_calls": getattr(raw_msg, "tool_calls", None),
+                                            "tool_call_id": getattr(raw_msg, "tool_call_id", None)
+                                        }
+                                    })
+
+                                # One async bulk append per update; the disk
+                                # write never blocks other SSE connections
+                                await storage.add_messages_async(
+                                    conversation_id, [p["data"] for p in batch]
+                                )
+
+                                # One frame per update: multi-message outputs ride
+                                # in a single 'batch' envelope the frontend unpacks
+                                if len(batch) == 1:
+                                    await send(batch[0])
+                                else:
+                                    await send({"type": "batch", "events": batch})
+
+                            # Handle Moderator Decision events (next_speaker)
+                            if "next_speaker" in node_output:
+                                await send({
+                                    "type": "status",
+                                    "data": f"Moderator decided: {node_output['next_speaker']} speaks next."
+                                }, critical=False)
+
+                # Make sure the title lands even if the stream finished first
+                await _finish_title(wait=True)
+                await send({'type': 'complete'})
+
+            except asyncio.CancelledError:
+                # The consumer cancelled us (client disconnect). It is no
+                # longer draining the queue, so a blocking put below could
+                # park this task forever on a full queue - exactly the
+                # slow-client case. Skip the sentinel; nobody reads it.
+                client_gone = True
+                raise
+            except Exception as e:
+                logger.exception("Stream error for conversation %s", conversation_id)
+                await send({'type': 'error', 'message': str(e)})
+            finally:
+                if not client_gone:
+                    # Consumer is live and draining, so this can't stall
+                    await queue.put(done)
+
+        producer = asyncio.create_task(produce())
         try:
-            # 1. Generate Title if new
-            if is_first_message:
-                title = await generate_conversation_title(request.content)
-                storage.update_conversation_title(conversation_id, title)
-                yield f"data: {json.dumps({'type': 'title', 'data': title})}\n\n"
-            
-            # 2. Stream Graph Events
-            # We use 'updates' mode to see what each node produces
-            # Use MlflowLangchainTracer to capture async events
-            config = {"callbacks": [MlflowLangchainTracer()]}
-            
-            with mlflow.start_run(run_name=f"Debate: {conversation_id[:8]}", nested=True):
-                async for event in graph_app.astream(initial_state, config=config, stream_mode="updates"):
-                    for node_name, node_output in event.items():
-                        
-                        # Extract message from the node output
-                        if "messages" in node_output and node_output["messages"]:
-                            last_msg = node_output["messages"][-1]
-                            content = last_msg.content
-                            sender_name = getattr(last_msg, "name", node_name)
-                            
-                            # Prepare payload
-                            raw_msg = last_msg
-                            msg_type = "message"
-                            
-                            # Detect Message Type
-                            if raw_msg.type == "tool":
-                                msg_type = "tool_output"
-                                sender_name = "Tool" # Or specific tool name if available
-                            elif raw_msg.type == "ai" and getattr(raw_msg, "tool_calls", None):
-                                msg_type = "tool_call"
-                            
-                            payload = {
-                                "type": msg_type,
-                                "data": {
-                                    "role": "assistant" if raw_msg.type == "ai" else "tool",
-                                    "name": sender_name,
-                                    "content": content,
-                                    "tool_calls": getattr(raw_msg, "tool_calls", None),
-                                    "tool_call_id": getattr(raw_msg, "tool_call_id", None)
-                                }
-                            }
-                            
-                            # Save to storage immediately
-                            storage.add_message(conversation_id, payload["data"])
-                            
-                            # Stream to client
-                            yield f"data: {json.dumps(payload)}\n\n"
-                        
-                        # Handle Moderator Decision events (next_speaker)
-                        if "next_speaker" in node_output:
-                            decision = {
-                                "type": "status",
-                                "data": f"Moderator decided: {node_output['next_speaker']} speaks next."
-                            }
-                            yield f"data: {json.dumps(decision)}\n\n"
-
-            yield f"data: {json.dumps({'type': 'complete'})}\n\n"
-
-        except Exception as e:
-            print(f"Stream error: {e}")
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
-
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-        }
-    )
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                yield item
+        finally:
+            # Client gone (or stream finished): don't leave the graph running
+            producer.cancel()
+
+    # EventSourceResponse handles SSE framing, cache/keep-alive headers,
+    # X-Accel-Buffering, and sends keepalive pings so proxies don't drop
+    # the connection during long LLM generations.
+    return EventSourceResponse(event_generator(), ping=15)
 
 if __name__ == "__main__":
     import uvicorn
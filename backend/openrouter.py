@@ -1,19 +1,125 @@
+import asyncio
+import functools
+import logging
 import os
+import httpx
 from langchain_openai import ChatOpenAI
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# One shared async HTTP client behind every chat model. HTTP/2 multiplexes
+# the debate's concurrent calls over a single warm TLS connection, instead
+# of paying a TCP+TLS handshake per LLM call; keepalive keeps it warm
+# across turns.
+_ASYNC_CLIENT = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60.0),
+    timeout=httpx.Timeout(60.0, connect=5.0)
+)
+
+class BatchInvoker:
+    """
+    Coalesces LLM calls from concurrent debates into shared drain passes.
+
+    Each request runs its own sequential debate graph, so with several
+    debates in flight the OpenRouter connection pool sees a trickle of
+    isolated calls. Submitted calls queue up here and a background task
+    drains the queue every ~20ms, firing the pending calls together under
+    a per-model semaphore - the pool stays busy without being stampeded.
+
+    Within a single debate nothing changes semantically: submit() simply
+    awaits its own result.
+    """
+
+    def __init__(self, tick: float = 0.02, max_concurrency: int = 8):
+        self._tick = tick
+        self._max_concurrency = max_concurrency
+        self._queue = asyncio.Queue()
+        self._semaphores = {}
+        self._drainer = None
+
+    async def submit(self, llm, messages, model_name: str = None):
+        """Queue one chat call and wait for its result."""
+        future = asyncio.get_running_loop().create_future()
+        name = model_name or getattr(llm, "model_name", "default")
+        self._queue.put_nowait((llm, messages, name, future))
+        # Lazily (re)start the drainer so we never need a running loop at import
+        if self._drainer is None or self._drainer.done():
+            self._drainer = asyncio.create_task(self._drain_loop())
+        return await future
+
+    async def _drain_loop(self):
+        while True:
+            # Let calls accumulate for one tick, then fire the batch together
+            await asyncio.sleep(self._tick)
+            batch = []
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            if not batch:
+                return  # Go idle; the next submit() restarts us
+            for item in batch:
+                asyncio.create_task(self._invoke(*item))
+
+    async def _invoke(self, llm, messages, model_name, future):
+        if model_name not in self._semaphores:
+            self._semaphores[model_name] = asyncio.Semaphore(self._max_concurrency)
+        async with self._semaphores[model_name]:
+            # The waiter may have been cancelled while this call sat in the
+            # queue (client disconnect tears the graph down); don't burn
+            # tokens on a result nobody will collect
+            if future.done():
+                return
+            try:
+                result = await llm.ainvoke(messages)
+            except Exception as e:
+                # The waiter can also vanish mid-call - setting a result or
+                # exception on a cancelled future raises InvalidStateError
+                # inside this detached task, so guard both paths
+                if not future.done():
+                    future.set_exception(e)
+                else:
+                    logger.debug("Dropping error for cancelled LLM call: %s", e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+
+# Shared across all debates served by this process
+batch_invoker = BatchInvoker()
+
+async def prewarm_connection_pool():
+    """
+    Prime DNS + TCP + TLS to OpenRouter before the first real LLM call.
+
+    The shared client keeps connections warm afterwards, but the very first
+    debate of the process would otherwise pay the full handshake (~150-300ms)
+    on its opening call. Best-effort: any response, even an error status,
+    means the connection is established.
+    """
+    try:
+        await _ASYNC_CLIENT.get("https://openrouter.ai/api/v1", timeout=5.0)
+    except Exception as e:
+        logger.debug("Connection pre-warm failed (non-fatal): %s", e)
+
+@functools.lru_cache(maxsize=32)
 def get_chat_model(model_name: str, temperature: float = 0.7):
     """
     Returns a LangChain ChatOpenAI object configured for OpenRouter.
+
+    Cached per (model_name, temperature): constructing the client (retry
+    policy, headers, pydantic validation) is pure overhead to repeat, and
+    reuse keeps the shared connection pool warm between calls - for title
+    generation the construction cost rivals the LLM call itself.
     """
     api_key = os.getenv("OPENROUTER_API_KEY")
     if not api_key:
-        print("CRITICAL ERROR: OPENROUTER_API_KEY not found in environment.")
+        logger.critical("OPENROUTER_API_KEY not found in environment.")
         raise ValueError("OPENROUTER_API_KEY not found in .env")
 
-    print(f"Initializing ChatOpenAI for model: {model_name}")
+    # Lazy %s formatting: no string is built unless DEBUG is enabled
+    logger.debug("Initializing ChatOpenAI for model: %s", model_name)
 
     return ChatOpenAI(
         model=model_name,
@@ -22,8 +128,12 @@ def get_chat_model(model_name: str, temperature: float = 0.7):
         temperature=temperature,
         default_headers={
             "HTTP-Referer": "http://localhost:5173",
-            "X-Title": "LLM Parliament"
+            "X-Title": "LLM Parliament",
+            # Let OpenRouter use Anthropic prompt caching for the stable
+            # prompt prefixes (role/style sections lead every system prompt)
+            "anthropic-beta": "prompt-caching-2024-07-31"
         },
         max_retries=1, # Don't wait too long if it fails
-        request_timeout=60 # Timeout after 60s
+        request_timeout=60, # Timeout after 60s
+        http_async_client=_ASYNC_CLIENT # Shared HTTP/2 pool (async path)
     )
\ No newline at end of file
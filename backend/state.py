@@ -7,6 +7,10 @@ class DebateConfig(TypedDict):
     pro_model: str
     con_model: str
     moderator_model: str
+    # Cheaper models for the high-frequency sub-tasks (per-turn scoring
+    # transitions and history summarization)
+    moderator_transition_model: str
+    summary_model: str
     max_rounds: int
     enable_tools: bool
 
@@ -19,6 +23,15 @@ class DebateState(TypedDict):
     round_count: int
     speaker_order: List[str]  # e.g. ["pro", "con"]
     next_speaker: str
+
+    # Who spoke last among the agents (Proponent/Critic), so tool handovers
+    # don't need to rescan the message history to find the caller
+    last_agent_speaker: str
+
+    # Rolling summary of older messages, so the Moderator doesn't need
+    # to re-read the full history every turn
+    running_summary: str
+    summary_upto: int  # index into 'messages' up to which the summary covers
     
     # Store the user configuration
     config: DebateConfig
@@ -1,80 +1,228 @@
-"""JSON-based storage for conversations."""
+"""JSONL-based storage for conversations.
 
-import json
+Messages live in an append-only log ({id}.jsonl) with a small sidecar
+metadata file ({id}.meta.json). Appending a message is a single write to
+the end of the log, instead of the old parse-whole-file / rewrite-whole-file
+cycle whose cost grew with the length of the debate.
+"""
+
+import asyncio
 import os
+import threading
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator
 from pathlib import Path
+
+import aiofiles
+import orjson
+
 from .config import DATA_DIR
 
+# Summary index for the conversation list ({id: {created_at, title,
+# message_count}}), so /api/conversations doesn't re-scan and re-parse
+# every file in the data directory on each call. Storage functions run in
+# worker threads, hence the lock.
+_INDEX_LOCK = threading.Lock()
+
 def ensure_data_dir():
     """Ensure the data directory exists."""
     Path(DATA_DIR).mkdir(parents=True, exist_ok=True)
 
-def get_conversation_path(conversation_id: str) -> str:
-    return os.path.join(DATA_DIR, f"{conversation_id}.json")
+def get_messages_path(conversation_id: str) -> str:
+    return os.path.join(DATA_DIR, f"{conversation_id}.jsonl")
+
+def get_meta_path(conversation_id: str) -> str:
+    return os.path.join(DATA_DIR, f"{conversation_id}.meta.json")
+
+def _read_meta(conversation_id: str) -> Optional[Dict[str, Any]]:
+    path = get_meta_path(conversation_id)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+def _write_meta(meta: Dict[str, Any]):
+    with open(get_meta_path(meta['id']), 'wb') as f:
+        f.write(orjson.dumps(meta, option=orjson.OPT_INDENT_2))
+
+def get_index_path() -> str:
+    return os.path.join(DATA_DIR, "index.json")
+
+def _migrate_legacy_conversation(path: str) -> Optional[Dict[str, Any]]:
+    """Split a pre-JSONL conversation ({id}.json with an embedded 'messages'
+    list) into the current .meta.json + .jsonl pair.
+
+    Returns the new meta dict, or None if the file isn't a legacy
+    conversation. The legacy file is removed once the new pair is on disk.
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = orjson.loads(f.read())
+        meta = {
+            "id": data["id"],
+            "created_at": data["created_at"],
+            "title": data.get("title", "New Debate")
+        }
+    except Exception:
+        return None
+    # Don't clobber a conversation that already migrated
+    if not os.path.exists(get_meta_path(meta["id"])):
+        with open(get_messages_path(meta["id"]), 'wb') as f:
+            f.write(b"".join(orjson.dumps(m) + b"\n" for m in data.get("messages", [])))
+        _write_meta(meta)
+    os.remove(path)
+    return meta
+
+def _rebuild_index() -> Dict[str, Dict[str, Any]]:
+    """One-time scan for data dirs that predate the index file."""
+    # Conversations saved before the JSONL layout are single {id}.json
+    # files; split them into meta + log first so they survive the upgrade
+    for filename in os.listdir(DATA_DIR):
+        if (filename.endswith('.json') and not filename.endswith('.meta.json')
+                and filename != 'index.json'):
+            _migrate_legacy_conversation(os.path.join(DATA_DIR, filename))
+
+    index = {}
+    for filename in os.listdir(DATA_DIR):
+        if not filename.endswith('.meta.json'):
+            continue
+        try:
+            with open(os.path.join(DATA_DIR, filename), 'rb') as f:
+                meta = orjson.loads(f.read())
+            messages_path = get_messages_path(meta["id"])
+            if os.path.exists(messages_path):
+                with open(messages_path, 'r') as f:
+                    message_count = sum(1 for line in f if line.strip())
+            else:
+                message_count = 0
+            index[meta["id"]] = {
+                "created_at": meta["created_at"],
+                "title": meta.get("title", "New Debate"),
+                "message_count": message_count
+            }
+        except Exception:
+            continue
+    return index
+
+def _load_index() -> Dict[str, Dict[str, Any]]:
+    path = get_index_path()
+    if not os.path.exists(path):
+        index = _rebuild_index()
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(index))
+        return index
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+def _update_index(conversation_id: str, **fields):
+    """Merge summary fields for one conversation into the index file."""
+    with _INDEX_LOCK:
+        index = _load_index()
+        entry = index.setdefault(conversation_id, {})
+        if "increment_count" in fields:
+            entry["message_count"] = entry.get("message_count", 0) + fields.pop("increment_count")
+        entry.update(fields)
+        with open(get_index_path(), 'wb') as f:
+            f.write(orjson.dumps(index))
 
 def create_conversation(conversation_id: str) -> Dict[str, Any]:
     ensure_data_dir()
-    conversation = {
+    meta = {
         "id": conversation_id,
         "created_at": datetime.utcnow().isoformat(),
-        "title": "New Debate",
-        "messages": [] # Simple list of {role, name, content, type}
+        "title": "New Debate"
     }
-    path = get_conversation_path(conversation_id)
-    with open(path, 'w') as f:
-        json.dump(conversation, f, indent=2)
-    return conversation
+    _write_meta(meta)
+    # Touch the message log so the conversation exists even while empty
+    open(get_messages_path(conversation_id), 'a').close()
+    _update_index(conversation_id, created_at=meta["created_at"],
+                  title=meta["title"], message_count=0)
+    return {**meta, "messages": []}
 
-def get_conversation(conversation_id: str) -> Optional[Dict[str, Any]]:
-    path = get_conversation_path(conversation_id)
+def iter_messages(conversation_id: str) -> Iterator[Dict[str, Any]]:
+    """Stream messages from the log without materializing the whole list."""
+    path = get_messages_path(conversation_id)
     if not os.path.exists(path):
-        return None
+        return
     with open(path, 'r') as f:
-        return json.load(f)
+        for line in f:
+            line = line.strip()
+            if line:
+                yield orjson.loads(line)
 
-def save_conversation(conversation: Dict[str, Any]):
-    ensure_data_dir()
-    path = get_conversation_path(conversation['id'])
-    with open(path, 'w') as f:
-        json.dump(conversation, f, indent=2)
+def get_conversation(conversation_id: str) -> Optional[Dict[str, Any]]:
+    meta = _read_meta(conversation_id)
+    if meta is None:
+        # The conversation may still be sitting in the old single-file
+        # format (e.g. the index existed but this file was restored from a
+        # backup) - migrate it on first access
+        legacy_path = os.path.join(DATA_DIR, f"{conversation_id}.json")
+        if os.path.exists(legacy_path):
+            meta = _migrate_legacy_conversation(legacy_path)
+            if meta:
+                _update_index(
+                    conversation_id, created_at=meta["created_at"],
+                    title=meta["title"],
+                    message_count=sum(1 for _ in iter_messages(conversation_id))
+                )
+    if meta is None:
+        return None
+    conversation = dict(meta)
+    conversation["messages"] = list(iter_messages(conversation_id))
+    return conversation
 
 def list_conversations() -> List[Dict[str, Any]]:
     ensure_data_dir()
-    conversations = []
-    for filename in os.listdir(DATA_DIR):
-        if filename.endswith('.json'):
-            path = os.path.join(DATA_DIR, filename)
-            try:
-                with open(path, 'r') as f:
-                    data = json.load(f)
-                    conversations.append({
-                        "id": data["id"],
-                        "created_at": data["created_at"],
-                        "title": data.get("title", "New Debate"),
-                        "message_count": len(data["messages"])
-                    })
-            except Exception:
-                continue
+    # One index read instead of an O(N) listdir + parse of every meta file
+    with _INDEX_LOCK:
+        index = _load_index()
+    conversations = [{"id": cid, **entry} for cid, entry in index.items()]
     conversations.sort(key=lambda x: x["created_at"], reverse=True)
     return conversations
 
 def add_message(conversation_id: str, message: Dict[str, Any]):
     """
-    Generic add message function.
+    Append one message to the conversation log.
     Message should have: role, content, name (optional), type (optional)
+
+    This is the hot path during streaming: a single O(message) append,
+    independent of how long the conversation already is.
     """
-    conversation = get_conversation(conversation_id)
-    if conversation is None:
+    add_messages(conversation_id, [message])
+
+def add_messages(conversation_id: str, messages: List[Dict[str, Any]]):
+    """Bulk form of add_message: one open + one buffered write for the lot,
+    so a node that yields several messages (tool call + tool result) costs
+    a single append instead of one per message."""
+    if not messages:
+        return
+    if not os.path.exists(get_meta_path(conversation_id)):
         raise ValueError(f"Conversation {conversation_id} not found")
-    
-    conversation["messages"].append(message)
-    save_conversation(conversation)
+
+    with open(get_messages_path(conversation_id), 'ab') as f:
+        f.write(b"".join(orjson.dumps(m) + b"\n" for m in messages))
+    # Keep the listing's count in sync without ever re-counting the log
+    _update_index(conversation_id, increment_count=len(messages))
+
+async def add_messages_async(conversation_id: str, messages: List[Dict[str, Any]]):
+    """Async twin of add_messages for the streaming hot path.
+
+    The append goes through aiofiles, so callers await it directly instead
+    of bouncing every write through run_in_executor; the index bump still
+    runs in a thread because it takes the (threading) index lock.
+    """
+    if not messages:
+        return
+    if not os.path.exists(get_meta_path(conversation_id)):
+        raise ValueError(f"Conversation {conversation_id} not found")
+
+    async with aiofiles.open(get_messages_path(conversation_id), mode='ab') as f:
+        await f.write(b"".join(orjson.dumps(m) + b"\n" for m in messages))
+    await asyncio.to_thread(_update_index, conversation_id, increment_count=len(messages))
 
 def update_conversation_title(conversation_id: str, title: str):
-    conversation = get_conversation(conversation_id)
-    if conversation:
-        conversation["title"] = title
-        save_conversation(conversation)
-        
\ No newline at end of file
+    meta = _read_meta(conversation_id)
+    if meta:
+        meta["title"] = title
+        _write_meta(meta)
+        _update_index(conversation_id, title=title)
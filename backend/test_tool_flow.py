@@ -23,21 +23,23 @@ def add_numbers(a: int, b: int) -> int:
     return a + b
 
 # 3. Convert to LangChain Tool
+# Helper to wrap the decorated function
+# FastMCP decorators might wrap the function, so we need to be careful.
+# But for a simple test, we can just use the function we defined.
+
+# NOTE: FastMCP tools are registered in mcp._tools (dict) usually,
+# but let's just use the function directly since we defined it in this file.
+# Wrapped once at module level - from_function's schema synthesis isn't free.
+_TEST_TOOLS = [
+    StructuredTool.from_function(
+        func=add_numbers.fn, # Access the underlying function
+        name="add_numbers",
+        description="Add two numbers together."
+    )
+]
+
 def get_test_tools():
-    # Helper to wrap the decorated function
-    # FastMCP decorators might wrap the function, so we need to be careful.
-    # But for a simple test, we can just use the function we defined.
-    
-    # NOTE: FastMCP tools are registered in mcp._tools (dict) usually, 
-    # but let's just use the function directly since we defined it in this file.
-    
-    return [
-        StructuredTool.from_function(
-            func=add_numbers.fn, # Access the underlying function
-            name="add_numbers",
-            description="Add two numbers together."
-        )
-    ]
+    return _TEST_TOOLS
 
 from typing import Annotated, TypedDict
 from langgraph.graph.message import add_messages
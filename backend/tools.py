@@ -1,5 +1,6 @@
 import os
 import httpx
+from cachetools import TTLCache
 from fastmcp import FastMCP
 from dotenv import load_dotenv
 from langchain_core.tools import StructuredTool
@@ -11,8 +12,24 @@ load_dotenv()
 # This manages the tool definitions and allows us to use @mcp.tool()
 mcp = FastMCP("ParliamentLibrary")
 
+# One shared client for all searches. A fresh httpx.Client per call pays a
+# TCP+TLS handshake to api.search.brave.com every time an agent looks
+# something up; keepalive connections make repeat searches during a debate
+# nearly handshake-free. main.py closes this on shutdown.
+search_client = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+    timeout=10.0
+)
+
+# The pro/con/moderator agents often search the same keywords within a
+# debate. Warm queries come from memory instead of another Brave round-trip
+# (which also burns into the API rate limit). Entries expire after an hour
+# so "recent news" doesn't go stale.
+_SEARCH_CACHE = TTLCache(maxsize=512, ttl=3600)
+
 @mcp.tool()
-def search_web(query: str, max_results: int = 3) -> str:
+async def search_web(query: str, max_results: int = 3) -> str:
     """
     Search the web for facts, statistics, or recent news to support an argument.
     Use this when you need citations or evidence.
@@ -21,6 +38,10 @@ def search_web(query: str, max_results: int = 3) -> str:
     if not api_key:
         return "Error: Web Search is disabled (No BRAVE_API_KEY found in .env)."
 
+    cache_key = (query, max_results)
+    if cache_key in _SEARCH_CACHE:
+        return _SEARCH_CACHE[cache_key]
+
     url = "https://api.search.brave.com/res/v1/web/search"
     headers = {
         "X-Subscription-Token": api_key,
@@ -29,9 +50,8 @@ def search_web(query: str, max_results: int = 3) -> str:
     params = {"q": query, "count": max_results}
 
     try:
-        with httpx.Client() as client:
-            resp = client.get(url, headers=headers, params=params, timeout=10.0)
-            
+        resp = await search_client.get(url, headers=headers, params=params)
+
         if resp.status_code != 200:
             return f"Search failed with status {resp.status_code}"
 
@@ -48,8 +68,10 @@ def search_web(query: str, max_results: int = 3) -> str:
         
         if not results:
             return "No results found."
-            
-        return "\n".join(results)
+
+        # Only successful searches are cached; errors should retry next time
+        _SEARCH_CACHE[cache_key] = "\n".join(results)
+        return _SEARCH_CACHE[cache_key]
     
     except Exception as e:
         return f"Search error: {str(e)}"
@@ -69,22 +91,25 @@ def get_debate_rules() -> str:
     5. Decorum: Maintain a formal but passionate tone.
     """
 
+# Built once at import: from_function inspects signatures and synthesizes
+# Pydantic schemas, which is pure repeated cost per call - the tools
+# themselves never change.
+_TOOLS_LIST = [
+    StructuredTool.from_function(
+        coroutine=search_web.fn,
+        name="search_web",
+        description="Search the web for facts, statistics, or recent news to support an argument."
+    ),
+    StructuredTool.from_function(
+        func=get_debate_rules.fn,
+        name="get_debate_rules",
+        description="Retrieve the official Standing Orders (Rules of Debate)."
+    )
+]
+
 def get_tools_list():
     """
     Returns the FastMCP tools converted to LangChain StructuredTools.
     We manually wrap them to ensure we access the underlying function logic.
     """
-    return [
-        StructuredTool.from_function(
-            func=search_web.fn,
-            name="search_web",
-            description="Search the web for facts, statistics, or recent news to support an argument."
-        ),
-        StructuredTool.from_function(
-            func=get_debate_rules.fn,
-            name="get_debate_rules",
-            description="Retrieve the official Standing Orders (Rules of Debate)."
-        )
-    ]
-
-    
\ No newline at end of file
+    return _TOOLS_LIST
@@ -81,13 +81,14 @@ function App() {
             }));
 
             // 2. Stream Response
-            await api.sendMessageStream(
-                currentConversationId,
-                content,
-                debateConfig, // Pass the current config here
-                (eventType, event) => {
+            const handleStreamEvent = (eventType, event) => {
+
+                    if (eventType === 'batch') {
+                        // A node emitted several messages at once (e.g. tool
+                        // call + tool result); replay them through this handler
+                        (event.events || []).forEach((inner) => handleStreamEvent(inner.type, inner));
 
-                    if (eventType === 'message') {
+                    } else if (eventType === 'message') {
                         setCurrentConversation((prev) => {
                             const newMsg = event.data;
                             // Check if the last message is from the SAME speaker and has tool logs
@@ -97,14 +98,16 @@ function App() {
 
                             const lastMsg = prev.messages[prev.messages.length - 1];
 
-                            // If last message was a "Thinking" state (empty content + tools) from same person
-                            if (lastMsg && lastMsg.name === newMsg.name && lastMsg.isThinking) {
+                            // If last message was a "Thinking" state (empty content + tools) from same person,
+                            // or the live-streamed preview of this message, finalize it in place
+                            if (lastMsg && ((lastMsg.name === newMsg.name && lastMsg.isThinking) || lastMsg.isStreaming)) {
                                 // Update the existing message with final content
                                 const updatedMsgs = [...prev.messages];
                                 updatedMsgs[updatedMsgs.length - 1] = {
                                     ...lastMsg,
-                                    content: newMsg.content,
-                                    isThinking: false
+                                    ...newMsg,
+                                    isThinking: false,
+                                    isStreaming: false
                                 };
                                 return { ...prev, messages: updatedMsgs };
                             }
@@ -119,6 +122,29 @@ function App() {
                             return { ...prev, messages: [...prev.messages, newMsg] };
                         });
 
+                    } else if (eventType === 'token') {
+                        // Live preview of the message being generated; the
+                        // final 'message' event replaces it with the
+                        // authoritative content
+                        setCurrentConversation((prev) => {
+                            const lastMsg = prev.messages[prev.messages.length - 1];
+                            if (lastMsg && lastMsg.isStreaming) {
+                                const updatedMsgs = [...prev.messages];
+                                updatedMsgs[updatedMsgs.length - 1] = {
+                                    ...lastMsg,
+                                    content: lastMsg.content + event.data.content
+                                };
+                                return { ...prev, messages: updatedMsgs };
+                            }
+                            const newMsg = {
+                                role: 'assistant',
+                                name: event.data.node,
+                                content: event.data.content,
+                                isStreaming: true
+                            };
+                            return { ...prev, messages: [...prev.messages, newMsg] };
+                        });
+
                     } else if (eventType === 'tool_call') {
                         // Agent is calling a tool. Create/Update message with "Thinking" state
                         setCurrentConversation((prev) => {
@@ -175,7 +201,14 @@ function App() {
                         console.error('Stream error:', event.message);
                         setIsLoading(false);
                     }
-                });
+            };
+
+            await api.sendMessageStream(
+                currentConversationId,
+                content,
+                debateConfig, // Pass the current config here
+                handleStreamEvent
+            );
         } catch (error) {
             console.error('Failed to send message:', error);
             setIsLoading(false);